@@ -1,7 +1,8 @@
-import logging 
+import asyncio
+import logging
 from enum import Enum
 
-from .dirigera_lib_patch import HubX
+from .dirigera_lib_patch import EMPTY_SCENE_PREFIX, HubX
 from .scene import ikea_scene
 from .light import ikea_bulb
 from .base_classes import (
@@ -43,14 +44,36 @@ class ikea_gateway:
 
     async def make_devices(self, hass, ip, token):
         hub: HubX = HubX(token, ip)
-        
+
+        # Every fetch below is independent I/O against the hub, so run them
+        # concurrently on the executor instead of awaiting one at a time;
+        # setup latency becomes roughly the slowest fetch instead of the sum.
+        (
+            scenes,
+            lights,
+            blinds,
+            air_purifiers,
+            outlets,
+            snapshot,
+            open_close_sensors,
+            water_sensors,
+        ) = await asyncio.gather(
+            hass.async_add_executor_job(hub.get_scenes),
+            hass.async_add_executor_job(hub.get_lights),
+            hass.async_add_executor_job(hub.get_blinds),
+            hass.async_add_executor_job(hub.get_air_purifiers),
+            hass.async_add_executor_job(hub.get_outlets),
+            hass.async_add_executor_job(hub.snapshot),
+            hass.async_add_executor_job(hub.get_open_close_sensors),
+            hass.async_add_executor_job(hub.get_water_sensors),
+        )
+
         #Scenes
-        scenes = await hass.async_add_executor_job(hub.get_scenes)
         logger.debug(f"Found {len(scenes)} scenes...")
         empty_scenes = []
         non_empty_scenes = []
         for scene in scenes:
-            if scene.name.startswith("dirigera_integration_empty_scene_"):
+            if scene.name.startswith(EMPTY_SCENE_PREFIX):
                 empty_scenes.append(ikea_scene(hub,scene))
             else:
                 non_empty_scenes.append(ikea_scene(hub,scene))
@@ -59,47 +82,37 @@ class ikea_gateway:
         self.devices[HubDeviceType.SCENE] = non_empty_scenes
 
         #Light
-        lights = await hass.async_add_executor_job(hub.get_lights)
         logger.debug(f"Found {len(lights)} total of all light devices to setup...")
         self.devices[HubDeviceType.LIGHT] = [ikea_bulb(hub, light) for light in lights]
-        
+
         #Cover
-        blinds = await hass.async_add_executor_job(hub.get_blinds)
-        logger.debug(f"Found {len(lights)} total of all blinds devices to setup...")
+        logger.debug(f"Found {len(blinds)} total of all blinds devices to setup...")
         self.devices[HubDeviceType.BLIND] = [ikea_blinds_device(hass, hub, b) for b in blinds]
-        
+
         #Air Purifier
-        air_purifiers = await hass.async_add_executor_job(hub.get_air_purifiers)
         logger.debug(f"Found {len(air_purifiers)} total of all air purifiers devices to setup...")
         self.devices[HubDeviceType.AIR_PURIFIER] = [ikea_starkvind_air_purifier_device(hass, hub, a) for a in air_purifiers]
 
         #Outlets
-        outlets = await hass.async_add_executor_job(hub.get_outlets)
         logger.debug(f"Found {len(outlets)} total of all outlets devices to setup...")
         self.devices[HubDeviceType.OUTLET] = [ ikea_outlet_device(hass, hub, x) for x in outlets ]
-        
-        #Environment Sensor
-        environment_sensors = await hass.async_add_executor_job(hub.get_environment_sensors)
-        logger.debug(f"Found {len(environment_sensors)} total of all environment devices entities to setup...")
-        self.devices[HubDeviceType.ENVIRONMENT_SENSOR] = [ikea_vindstyrka_device(hass, hub, env_device) for env_device in environment_sensors]
-
-        #Controllers
-        controllers = await hass.async_add_executor_job(hub.get_controllers)
-        logger.debug(f"Found {len(controllers)} total of all controllers devices to setup...")
-        self.devices[HubDeviceType.CONTROLLER] = [ikea_controller_device(hass, hub, x) for x in controllers]
-        
+
+        #Environment Sensors, Controllers and Motion Sensors come off one
+        #snapshot so the hub only serves a single /devices GET for all three
+        logger.debug(f"Found {len(snapshot.environment_sensors)} total of all environment devices entities to setup...")
+        self.devices[HubDeviceType.ENVIRONMENT_SENSOR] = [ikea_vindstyrka_device(hass, hub, env_device) for env_device in snapshot.environment_sensors]
+
+        logger.debug(f"Found {len(snapshot.controllers)} total of all controllers devices to setup...")
+        self.devices[HubDeviceType.CONTROLLER] = [ikea_controller_device(hass, hub, x) for x in snapshot.controllers]
+
         #Open Close Sensors
-        open_close_sensors = await hass.async_add_executor_job(hub.get_open_close_sensors)
         logger.debug(f"Found {len(open_close_sensors)} total of all open_close devices to setup...")
         self.devices[HubDeviceType.OPEN_CLOSE_SENSOR] = [ikea_open_close_device(hass, hub, x) for x in open_close_sensors]
-        
-        #Motion Sensors
-        motion_sensors = await hass.async_add_executor_job(hub.get_motion_sensors)
-        logger.debug(f"Found {len(motion_sensors)} total of all motion_sensors devices to setup...")
-        self.devices[HubDeviceType.MOTION_SENSOR] = [ikea_motion_sensor_device(hass, hub, x) for x in motion_sensors]
+
+        logger.debug(f"Found {len(snapshot.motion_sensors)} total of all motion_sensors devices to setup...")
+        self.devices[HubDeviceType.MOTION_SENSOR] = [ikea_motion_sensor_device(hass, hub, x) for x in snapshot.motion_sensors]
         
         #Water Sensors
-        water_sensors = await hass.async_add_executor_job(hub.get_water_sensors)
         logger.debug(f"Found {len(water_sensors)} total of all water_sensors devices to setup...")
         self.devices[HubDeviceType.WATER_SENSOR] = [ikea_water_sensor_device(hass, hub, x) for x in water_sensors]
 